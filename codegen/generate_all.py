@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Run all pentagi-taxonomy code generators in a single process.
+Validates and normalizes the schema once and passes it to the Go, Python and
+TypeScript generators.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+CODEGEN_DIR = Path(__file__).resolve().parent
+LANGUAGES = ("python", "go", "typescript")
+
+# Add shared validator to path
+sys.path.insert(0, str(CODEGEN_DIR / "shared"))
+from validator import normalize_schema, validate_schema, SchemaValidationError
+
+
+def load_generator(language: str) -> ModuleType:
+    """Import codegen/<language>/generate.py as a module."""
+    spec = importlib.util.spec_from_file_location(
+        f"{language}_generate", CODEGEN_DIR / language / "generate.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python generate_all.py <version>")
+        print("Example: python generate_all.py 2")
+        sys.exit(1)
+    
+    version_arg = sys.argv[1]
+    
+    # Determine paths
+    version_dir = CODEGEN_DIR.parent / f"v{version_arg}"
+    schema_path = version_dir / "entities.yml"
+    
+    print(f"Validating schema {schema_path}...")
+    
+    # Validate schema once for all generators
+    try:
+        schema = validate_schema(schema_path)
+    except SchemaValidationError as e:
+        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    # One normalization pass shared by every generator
+    normalized = normalize_schema(schema)
+    
+    for language in LANGUAGES:
+        print()
+        generator = load_generator(language)
+        generator.generate(normalized, version_dir, CODEGEN_DIR / "templates" / language)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,202 +5,189 @@ Generates Go structs with validation tags from YAML entity definitions using Jin
 """
 
 import sys
-import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
-from jinja2 import Environment, FileSystemLoader
+from typing import Any, Dict, List, Tuple
 
 
 # Add shared validator to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
-from validator import validate_schema, SchemaValidationError
+from validator import validate_schema, interned_mapping, normalize_schema, pascal_case, NormalizedEntities, NormalizedSchema, NormField, SchemaValidationError
+from jinja_env import get_env
+from writer import format_write_summary, render_if_changed
 
 
-def to_pascal_case(snake_case: str) -> str:
-    """Convert snake_case to PascalCase."""
-    return ''.join(word.capitalize() for word in snake_case.split('_'))
+# Go pointer types for each YAML primitive type
+GO_TYPE_MAP = interned_mapping({
+    "string": "*string",
+    "int": "*int",
+    "float": "*float64",
+    "boolean": "*bool",
+    "timestamp": "*float64",
+})
+
+# Regex kinds with a built-in validator/v10 equivalent
+GO_REGEX_VALIDATORS = frozenset({"ipv4", "email", "url"})
 
 
 def go_type_from_yaml(yaml_type: str) -> str:
     """Convert YAML type to Go type."""
     if yaml_type.endswith("[]"):
-        base_type = yaml_type[:-2]
-        go_base = go_type_from_yaml(base_type)
-        return f"*[]{go_base}"
-    
-    type_map = {
-        "string": "*string",
-        "int": "*int",
-        "float": "*float64",
-        "boolean": "*bool",
-        "timestamp": "*float64",
-    }
-    return type_map.get(yaml_type, "*string")
-
-
-def is_ipv4_regex(regex: str) -> bool:
-    """Check if regex pattern matches IPv4."""
-    ipv4_patterns = [
-        r"^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$",
-        r"^(?:[0-9]+\.){3}[0-9]+$",
-    ]
-    normalized = regex.replace("\\\\", "\\")
-    return any(pattern in normalized for pattern in ipv4_patterns)
+        return sys.intern("*[]" + GO_TYPE_MAP.get(yaml_type[:-2], "*string"))
+    return GO_TYPE_MAP.get(yaml_type, "*string")
 
 
-def validation_tag_from_field(field_def: Dict[str, Any]) -> str:
+def validation_tag_from_field(spec: NormField) -> str:
     """Generate validator/v10 struct tag for a field."""
-    yaml_type = field_def.get("type", "string")
-    base_type = yaml_type.rstrip("[]")
+    # Most fields are unconstrained; skip building the tag list for them
+    if not spec.has_constraints:
+        return ""
     
     tags = ["omitempty"]
     
     # Enum validation
-    if "enum" in field_def:
-        enum_values = field_def["enum"]
-        enum_str = " ".join(enum_values)
+    if spec.enum is not None:
+        enum_str = " ".join(spec.enum)
         tags.append(f"oneof={enum_str}")
     
     # Regex validation (map to built-in validators where possible)
-    if "regex" in field_def and "enum" not in field_def:
-        regex = field_def["regex"]
-        if is_ipv4_regex(regex):
-            tags.append("ipv4")
-        elif "email" in regex.lower():
-            tags.append("email")
-        elif regex.startswith("^https?://"):
-            tags.append("url")
+    if spec.regex_kind is not None and spec.enum is None:
+        if spec.regex_kind in GO_REGEX_VALIDATORS:
+            tags.append(spec.regex_kind)
         # For other regex patterns, we'd need custom validators
         # For now, skip custom regex validators in generated code
     
     # Min/max validation
-    if "min" in field_def:
-        tags.append(f"min={field_def['min']}")
-    if "max" in field_def:
-        tags.append(f"max={field_def['max']}")
+    if spec.minimum is not None:
+        tags.append(f"min={spec.minimum}")
+    if spec.maximum is not None:
+        tags.append(f"max={spec.maximum}")
     
     if len(tags) > 1:  # More than just "omitempty"
         return f'validate:"{",".join(tags)}"'
     return ""
 
 
-def prepare_field_for_go(field_name: str, field_def: Dict[str, Any]) -> Dict[str, Any]:
+@lru_cache(maxsize=4096)
+def emit_go(spec: NormField) -> Tuple[str, str]:
+    """Return the Go type and validate tag for a normalized field."""
+    return go_type_from_yaml(spec.yaml_type), validation_tag_from_field(spec)
+
+
+def prepare_field_for_go(field_name: str, spec: NormField, description: str) -> Dict[str, Any]:
     """Prepare field data for Go struct generation."""
-    go_type = go_type_from_yaml(field_def.get("type", "string"))
-    go_name = to_pascal_case(field_name)
-    
-    # Build struct tags
-    json_tag = f'json:"{field_name},omitempty"'
-    validate_tag = validation_tag_from_field(field_def)
+    go_type, validate_tag = emit_go(spec)
+    go_name = pascal_case(field_name)
     
-    if validate_tag:
-        struct_tag = f'`{json_tag} {validate_tag}`'
-    else:
-        struct_tag = f'`{json_tag}`'
+    # Build struct tags in one f-string
+    validate_part = f" {validate_tag}" if validate_tag else ""
+    struct_tag = f'`json:"{field_name},omitempty"{validate_part}`'
     
     return {
         "go_name": go_name,
         "go_type": go_type,
         "struct_tag": struct_tag,
-        "description": field_def.get("description", "")
+        "description": description
     }
 
 
-def prepare_nodes_data(schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Prepare node data for template rendering."""
-    nodes = {}
-    for node_name, node_def in schema.get("nodes", {}).items():
+def prepare_entities_data(entities: NormalizedEntities) -> Dict[str, Any]:
+    """Prepare node or edge data for template rendering."""
+    result = {}
+    for i, entity_name in enumerate(entities.names):
         fields = {}
-        for field_name, field_def in node_def.get("fields", {}).items():
-            fields[field_name] = prepare_field_for_go(field_name, field_def)
+        for field_name, spec, description in entities.fields(i):
+            fields[field_name] = prepare_field_for_go(field_name, spec, description)
         
-        nodes[node_name] = {
-            "description": node_def.get("description", ""),
+        result[entity_name] = {
+            "class_name": entities.class_names[i],
+            "description": entities.descriptions[i],
             "fields": fields
         }
     
-    return nodes
+    return result
+
+
+def prepare_nodes_data(normalized: NormalizedSchema) -> Dict[str, Any]:
+    """Prepare node data for template rendering."""
+    return prepare_entities_data(normalized.nodes)
 
 
-def prepare_edges_data(schema: Dict[str, Any]) -> Dict[str, Any]:
+def prepare_edges_data(normalized: NormalizedSchema) -> Dict[str, Any]:
     """Prepare edge data for template rendering."""
-    edges = {}
-    for edge_name, edge_def in schema.get("edges", {}).items():
-        # Convert SCREAMING_SNAKE_CASE to PascalCase
-        class_name = ''.join(word.capitalize() for word in edge_name.split('_'))
-        
-        fields = {}
-        for field_name, field_def in edge_def.get("fields", {}).items():
-            fields[field_name] = prepare_field_for_go(field_name, field_def)
-        
-        edges[edge_name] = {
-            "class_name": class_name,
-            "description": edge_def.get("description", ""),
-            "fields": fields
-        }
-    
-    return edges
+    return prepare_entities_data(normalized.edges)
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python generate.py <version>")
-        print("Example: python generate.py 2")
-        sys.exit(1)
-    
-    version_arg = sys.argv[1]
+def generate(normalized: NormalizedSchema, version_dir: Path, templates_dir: Path) -> None:
+    """
+    Generate the Go module for an already-validated schema.
     
-    # Determine paths
-    codegen_dir = Path(__file__).parent.parent.parent
-    version_dir = codegen_dir / f"v{version_arg}"
-    schema_path = version_dir / "entities.yml"
+    Args:
+        normalized: Normalized view of the validated schema
+        version_dir: Version directory (e.g. v2/) the output is written under
+        templates_dir: Directory containing the Go templates
+    """
+    schema_version = normalized.version
     output_dir = version_dir / "go"
     entities_dir = output_dir / "entities"
-    templates_dir = codegen_dir / "codegen" / "templates" / "go"
     
-    print(f"Generating Go code for version {version_arg}...")
-    print(f"  Schema: {schema_path}")
+    print(f"Generating Go code for version {schema_version}...")
     print(f"  Output: {output_dir}")
     
-    # Validate schema
-    try:
-        schema = validate_schema(schema_path)
-    except SchemaValidationError as e:
-        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
-        sys.exit(1)
-    
-    schema_version = schema.get("version", int(version_arg))
-    
     # Create output directories
     entities_dir.mkdir(parents=True, exist_ok=True)
     
     # Setup Jinja2 environment
-    env = Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+    env = get_env(str(templates_dir))
     
     # Prepare data for templates
-    nodes_data = prepare_nodes_data(schema)
-    edges_data = prepare_edges_data(schema)
+    nodes_data = prepare_nodes_data(normalized)
+    edges_data = prepare_edges_data(normalized)
+    
+    # Generate files (unchanged outputs are left untouched)
+    written = []
     
-    # Generate files
     print("  Generating go.mod...")
     go_mod_template = env.get_template("go.mod.j2")
-    go_mod = go_mod_template.render(version=schema_version, org="yourorg")
-    (output_dir / "go.mod").write_text(go_mod)
+    written.append(render_if_changed(output_dir / "go.mod", go_mod_template, version=schema_version, org="yourorg"))
     
     print("  Generating entities/entities.go...")
     entities_template = env.get_template("entities.go.j2")
-    entities_content = entities_template.render(nodes=nodes_data, edges=edges_data)
-    (entities_dir / "entities.go").write_text(entities_content)
+    written.append(render_if_changed(entities_dir / "entities.go", entities_template, nodes=nodes_data, edges=edges_data))
     
     print("  Generating entities/validators.go...")
     validators_template = env.get_template("validators.go.j2")
-    validators_content = validators_template.render(nodes=nodes_data, edges=edges_data)
-    (entities_dir / "validators.go").write_text(validators_content)
+    written.append(render_if_changed(entities_dir / "validators.go", validators_template, nodes=nodes_data, edges=edges_data))
     
     print(f"✓ Go code generation complete!")
+    print(f"  {format_write_summary(written)}")
     print(f"  Generated {len(nodes_data)} node structs")
     print(f"  Generated {len(edges_data)} edge structs")
 
 
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python generate.py <version>")
+        print("Example: python generate.py 2")
+        sys.exit(1)
+    
+    version_arg = sys.argv[1]
+    
+    # Determine paths
+    repo_dir = Path(__file__).resolve().parent.parent.parent
+    version_dir = repo_dir / f"v{version_arg}"
+    schema_path = version_dir / "entities.yml"
+    templates_dir = repo_dir / "codegen" / "templates" / "go"
+    
+    # Validate schema
+    try:
+        schema = validate_schema(schema_path)
+    except SchemaValidationError as e:
+        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    generate(normalize_schema(schema), version_dir, templates_dir)
+
+
 if __name__ == "__main__":
     main()
@@ -4,179 +4,254 @@ Python code generator for pentagi-taxonomy.
 Generates Pydantic models from YAML entity definitions using Jinja2 templates.
 """
 
+import re
 import sys
-import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
-from jinja2 import Environment, FileSystemLoader
+from typing import Any, Dict, List, Tuple
 
 
 # Add shared validator to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
-from validator import validate_schema, SchemaValidationError
+from validator import validate_schema, interned_mapping, load_yaml, normalize_schema, NormalizedEntities, NormalizedSchema, NormField, SchemaValidationError
+from jinja_env import get_env
+from writer import format_write_summary, render_if_changed
+
+
+# Python type hints for each YAML primitive type
+PYTHON_TYPE_MAP = interned_mapping({
+    "string": "str",
+    "int": "int",
+    "float": "float",
+    "boolean": "bool",
+    "timestamp": "int",
+})
+
+
+# Literal tag field added to every model for discriminated-union validation
+# (listed in validator.RESERVED_FIELD_NAMES, so schemas cannot declare it)
+DISCRIMINATOR_FIELD = "type"
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def snake_case(class_name: str) -> str:
+    """Convert a PascalCase class name to snake_case (e.g. HasPort -> has_port)."""
+    return _CAMEL_BOUNDARY.sub("_", class_name).lower()
 
 
 def python_type_from_yaml(yaml_type: str) -> str:
     """Convert YAML type to Python type hint."""
     if yaml_type.endswith("[]"):
-        base_type = yaml_type[:-2]
-        python_base = python_type_from_yaml(base_type)
-        return f"list[{python_base}]"
-    
-    type_map = {
-        "string": "str",
-        "int": "int",
-        "float": "float",
-        "boolean": "bool",
-        "timestamp": "float",
-    }
-    return type_map.get(yaml_type, "str")
+        return sys.intern(f"list[{PYTHON_TYPE_MAP.get(yaml_type[:-2], 'str')}]")
+    return PYTHON_TYPE_MAP.get(yaml_type, "str")
 
 
-def prepare_field_for_pydantic(field_name: str, field_def: Dict[str, Any]) -> Dict[str, Any]:
-    """Prepare field data for Pydantic Field definition."""
-    yaml_type = field_def.get("type", "string")
-    python_type = python_type_from_yaml(yaml_type)
-    description = field_def.get("description", "")
+@lru_cache(maxsize=4096)
+def emit_pydantic(spec: NormField) -> Tuple[str, str, Tuple[str, ...]]:
+    """Return the type hint, model annotation and Field() constraint kwargs for a normalized field."""
+    python_type = python_type_from_yaml(spec.yaml_type)
     
-    # Build Field() arguments
-    field_args = ["None"]
-    field_kwargs = []
-    
-    if description:
-        field_kwargs.append(f"description={repr(description)}")
+    # Timestamps are integer microseconds since the Unix epoch (Python only; Go and
+    # TypeScript keep float seconds) and never negative unless the schema says so
+    minimum = spec.minimum
+    if spec.base_type == "timestamp" and minimum is None:
+        minimum = "0"
     
     # Add validation constraints
-    if "min" in field_def:
-        field_kwargs.append(f"ge={field_def['min']}")
-    if "max" in field_def:
-        field_kwargs.append(f"le={field_def['max']}")
+    constraint_kwargs = []
+    if minimum is not None:
+        constraint_kwargs.append(f"ge={minimum}")
+    if spec.maximum is not None:
+        constraint_kwargs.append(f"le={spec.maximum}")
+    
+    # Whole-number floats would otherwise pass as microseconds; legacy seconds go through pentagi_taxonomy.legacy
+    if spec.base_type == "timestamp":
+        constraint_kwargs.append("strict=True")
     
     # Handle enum as Literal type
-    if "enum" in field_def:
-        enum_values = field_def["enum"]
-        enum_str = ", ".join(repr(v) for v in enum_values)
+    if spec.enum is not None:
+        enum_str = ", ".join(map(repr, spec.enum))
         python_type = f"Literal[{enum_str}]"
     
-    field_call = ", ".join(field_args + field_kwargs)
+    # Array constraints apply to each element (as in Zod), not to the list itself
+    if spec.is_array and constraint_kwargs and spec.enum is None:
+        element_type = PYTHON_TYPE_MAP.get(spec.base_type, "str")
+        annotation = sys.intern(f"list[Annotated[{element_type}, Field({', '.join(constraint_kwargs)})]]")
+        return python_type, annotation, ()
+    
+    return python_type, python_type, tuple(constraint_kwargs)
+
+
+def prepare_field_for_pydantic(field_name: str, spec: NormField, description: str) -> Dict[str, Any]:
+    """Prepare field data for Pydantic Field definition."""
+    python_type, annotation, constraint_kwargs = emit_pydantic(spec)
+    
+    # Build Field() arguments; descriptions live in the _FIELD_DOCS side table
+    field_call = ", ".join(("None",) + constraint_kwargs)
     
     return {
         "python_type": python_type,
+        "annotation": annotation,
         "field_args": field_call,
-        "description": description
+        "description": repr(description) if description else None
     }
 
 
-def prepare_nodes_data(schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Prepare node data for template rendering."""
-    nodes = {}
-    for node_name, node_def in schema.get("nodes", {}).items():
+def prepare_entities_data(entities: NormalizedEntities) -> Dict[str, Any]:
+    """Prepare node or edge data for template rendering."""
+    result = {}
+    for i, entity_name in enumerate(entities.names):
         fields = {}
-        for field_name, field_def in node_def.get("fields", {}).items():
-            fields[field_name] = prepare_field_for_pydantic(field_name, field_def)
+        timestamp_fields = []
+        for field_name, spec, description in entities.fields(i):
+            fields[field_name] = prepare_field_for_pydantic(field_name, spec, description)
+            if spec.base_type == "timestamp":
+                timestamp_fields.append(field_name)
         
-        nodes[node_name] = {
-            "description": node_def.get("description", ""),
-            "fields": fields
+        class_name = entities.class_names[i]
+        result[entity_name] = {
+            "class_name": class_name,
+            "snake_name": snake_case(class_name),
+            "description": entities.descriptions[i],
+            "fields": fields,
+            "timestamp_fields": timestamp_fields
         }
     
-    return nodes
+    return result
 
 
-def prepare_edges_data(schema: Dict[str, Any]) -> Dict[str, Any]:
+def prepare_nodes_data(normalized: NormalizedSchema) -> Dict[str, Any]:
+    """Prepare node data for template rendering."""
+    return prepare_entities_data(normalized.nodes)
+
+
+def prepare_edges_data(normalized: NormalizedSchema) -> Dict[str, Any]:
     """Prepare edge data for template rendering."""
-    edges = {}
-    for edge_name, edge_def in schema.get("edges", {}).items():
-        # Convert SCREAMING_SNAKE_CASE to PascalCase for class name
-        class_name = ''.join(word.capitalize() for word in edge_name.split('_'))
-        
-        fields = {}
-        for field_name, field_def in edge_def.get("fields", {}).items():
-            fields[field_name] = prepare_field_for_pydantic(field_name, field_def)
-        
-        edges[edge_name] = {
-            "class_name": class_name,
-            "description": edge_def.get("description", ""),
-            "fields": fields
-        }
+    return prepare_entities_data(normalized.edges)
+
+
+def prepare_relationships_data(normalized: NormalizedSchema) -> Dict[Tuple[str, str], List[str]]:
+    """Index relationship edge types by (source, target) node pair."""
+    index: Dict[Tuple[str, str], List[str]] = {}
+    for rel in normalized.relationships:
+        edge_names = index.setdefault((rel["source"], rel["target"]), [])
+        edge_names.extend(edge for edge in rel["edges"] if edge not in edge_names)
     
-    return edges
+    return index
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python generate.py <version>")
-        print("Example: python generate.py 2")
-        sys.exit(1)
+def prepare_edge_lookup_data(relationships: Dict[Tuple[str, str], List[str]]) -> Dict[str, Dict[str, str]]:
+    """Nest relationships as source -> target -> edge-name tuple literal."""
+    lookup: Dict[str, Dict[str, str]] = {}
+    for (source, target), edge_names in relationships.items():
+        lookup.setdefault(source, {})[target] = repr(tuple(edge_names))
     
-    version_arg = sys.argv[1]
+    return lookup
+
+
+def generate(normalized: NormalizedSchema, version_dir: Path, templates_dir: Path) -> None:
+    """
+    Generate the Python package for an already-validated schema.
     
-    # Determine paths
-    codegen_dir = Path(__file__).parent.parent.parent
-    version_dir = codegen_dir / f"v{version_arg}"
-    schema_path = version_dir / "entities.yml"
+    Args:
+        normalized: Normalized view of the validated schema
+        version_dir: Version directory (e.g. v2/) the output is written under
+        templates_dir: Directory containing the Python templates
+    """
+    schema_version = normalized.version
     output_dir = version_dir / "python" / "pentagi_taxonomy"
-    templates_dir = codegen_dir / "codegen" / "templates" / "python"
     
-    print(f"Generating Python code for version {version_arg}...")
-    print(f"  Schema: {schema_path}")
+    print(f"Generating Python code for version {schema_version}...")
     print(f"  Output: {output_dir}")
     
-    # Validate schema
-    try:
-        schema = validate_schema(schema_path)
-    except SchemaValidationError as e:
-        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
-        sys.exit(1)
-    
     # Read global version from version.yml
-    version_yml_path = codegen_dir / "version.yml"
-    with open(version_yml_path, 'r') as f:
-        version_data = yaml.safe_load(f)
-        global_version = version_data.get("version", int(version_arg))
-    
-    # Use the version from the schema file itself
-    schema_version = schema.get("version", int(version_arg))
+    version_yml_path = version_dir.parent / "version.yml"
+    with open(version_yml_path, 'rb') as f:
+        version_data = load_yaml(f)
+        global_version = version_data.get("version", schema_version)
     
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Setup Jinja2 environment
-    env = Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+    env = get_env(str(templates_dir))
     
     # Prepare data for templates
-    nodes_data = prepare_nodes_data(schema)
-    edges_data = prepare_edges_data(schema)
+    nodes_data = prepare_nodes_data(normalized)
+    edges_data = prepare_edges_data(normalized)
+    
+    # Generate files (unchanged outputs are left untouched)
+    written = []
     
-    # Generate files
     print("  Generating __init__.py...")
     init_template = env.get_template("__init__.py.j2")
-    init_content = init_template.render(version=schema_version)
-    (output_dir / "__init__.py").write_text(init_content)
+    written.append(render_if_changed(output_dir / "__init__.py", init_template, version=schema_version, nodes=nodes_data, edges=edges_data))
     
     print("  Generating nodes.py...")
     nodes_template = env.get_template("nodes.py.j2")
-    nodes_content = nodes_template.render(nodes=nodes_data)
-    (output_dir / "nodes.py").write_text(nodes_content)
+    written.append(render_if_changed(output_dir / "nodes.py", nodes_template, nodes=nodes_data, discriminator=DISCRIMINATOR_FIELD))
     
     print("  Generating edges.py...")
     edges_template = env.get_template("edges.py.j2")
-    edges_content = edges_template.render(edges=edges_data)
-    (output_dir / "edges.py").write_text(edges_content)
+    written.append(render_if_changed(output_dir / "edges.py", edges_template, edges=edges_data, discriminator=DISCRIMINATOR_FIELD))
     
     print("  Generating entity_map.py...")
+    relationships = prepare_relationships_data(normalized)
     entity_map_template = env.get_template("entity_map.py.j2")
-    entity_map_content = entity_map_template.render(
+    written.append(render_if_changed(
+        output_dir / "entity_map.py",
+        entity_map_template,
         nodes=nodes_data,
         edges=edges_data,
-        relationships=schema.get("relationships", [])
-    )
-    (output_dir / "entity_map.py").write_text(entity_map_content)
+        discriminator=DISCRIMINATOR_FIELD,
+        edge_lookup=prepare_edge_lookup_data(relationships)
+    ))
+    
+    for kind, entities_data in (("node", nodes_data), ("edge", edges_data)):
+        print(f"  Generating {kind}s_fast.py...")
+        fast_template = env.get_template("fast.py.j2")
+        written.append(render_if_changed(
+            output_dir / f"{kind}s_fast.py",
+            fast_template,
+            kind=kind,
+            entities=entities_data,
+            discriminator=DISCRIMINATOR_FIELD
+        ))
+    
+    print("  Generating legacy.py...")
+    legacy_template = env.get_template("legacy.py.j2")
+    written.append(render_if_changed(output_dir / "legacy.py", legacy_template, nodes=nodes_data, edges=edges_data))
     
     print(f"✓ Python code generation complete!")
+    print(f"  {format_write_summary(written)}")
     print(f"  Generated {len(nodes_data)} node models")
     print(f"  Generated {len(edges_data)} edge models")
 
 
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python generate.py <version>")
+        print("Example: python generate.py 2")
+        sys.exit(1)
+    
+    version_arg = sys.argv[1]
+    
+    # Determine paths
+    repo_dir = Path(__file__).resolve().parent.parent.parent
+    version_dir = repo_dir / f"v{version_arg}"
+    schema_path = version_dir / "entities.yml"
+    templates_dir = repo_dir / "codegen" / "templates" / "python"
+    
+    # Validate schema
+    try:
+        schema = validate_schema(schema_path)
+    except SchemaValidationError as e:
+        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    generate(normalize_schema(schema), version_dir, templates_dir)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,41 @@
+"""
+Shared Jinja2 environment setup for pentagi-taxonomy code generators.
+Environments are cached per templates directory and compiled templates are
+persisted to disk, so repeated generator runs skip template parsing.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+COMPILED_DIR_NAME = "__compiled__"
+
+
+@lru_cache(maxsize=None)
+def get_env(templates_dir: str) -> Environment:
+    """
+    Return a cached Jinja2 environment for a templates directory.
+
+    Compiled template bytecode is stored in '<templates_dir>/__compiled__'.
+    Each cache entry is checked against the template source checksum, so
+    edited templates are recompiled instead of being served stale.
+
+    Args:
+        templates_dir: Directory containing the .j2 templates
+
+    Returns:
+        Configured Jinja2 environment
+    """
+    compiled_dir = Path(templates_dir) / COMPILED_DIR_NAME
+    compiled_dir.mkdir(exist_ok=True)
+
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=FileSystemBytecodeCache(str(compiled_dir)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
@@ -0,0 +1,37 @@
+"""
+Optional mypyc build of the shared schema validator.
+
+Compiles a copy of validator.py into a separate 'validator_c' C extension
+placed next to it. The copy records the digest of the source it was built
+from, and validator.py only switches to the extension while that digest
+still matches its own source, so editing validator.py never runs stale
+compiled rules; rebuild to pick the speedup up again.
+
+Usage (from this directory, requires mypy and a C compiler):
+    python setup_mypyc.py build_ext --inplace
+"""
+
+import hashlib
+from pathlib import Path
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+
+SOURCE = Path("validator.py")
+COMPILED_SOURCE = Path("validator_c.py")
+
+source = SOURCE.read_bytes()
+digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+COMPILED_SOURCE.write_bytes(
+    source + f'\n\n# Digest of the validator.py source this module was compiled from\nSOURCE_DIGEST = "{digest}"\n'.encode()
+)
+
+try:
+    setup(
+        name="pentagi-taxonomy-validator",
+        ext_modules=mypycify([str(COMPILED_SOURCE)]),
+    )
+finally:
+    # Only the extension should be importable as validator_c
+    COMPILED_SOURCE.unlink()
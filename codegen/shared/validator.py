@@ -3,12 +3,48 @@ Shared schema validation logic for pentagi-taxonomy.
 Used by all code generators to ensure consistent validation.
 """
 
+import copy
+import hashlib
+import importlib
+import os
+import pickle
+import re
+import sys
+import tempfile
 import yaml
-from typing import Any, Dict, List, Set
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, IO, Iterator, List, Mapping, Optional, Set, Tuple, Union
 from pathlib import Path
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+# (PyYAML only defines CSafeLoader when built with libyaml)
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# CI can set this to fail fast when PyYAML was built without libyaml
+if os.environ.get("PENTAGI_REQUIRE_LIBYAML") and not yaml.__with_libyaml__:
+    raise ImportError("PyYAML is installed without libyaml support (PENTAGI_REQUIRE_LIBYAML is set)")
+
 
 SUPPORTED_PRIMITIVE_TYPES = {"string", "int", "float", "boolean", "timestamp"}
+_SUPPORTED_TYPES_STR = ", ".join(sorted(SUPPORTED_PRIMITIVE_TYPES))
+_NUMERIC_TYPES = frozenset({"int", "float", "timestamp"})
+
+# Field names generators claim for themselves (the Python models' discriminator tag)
+RESERVED_FIELD_NAMES = frozenset({"type"})
+
+# Known IPv4 regex patterns, classified as regex_kind 'ipv4'
+IPV4_PATTERN = re.compile("|".join(re.escape(pattern) for pattern in (
+    r"^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$",
+    r"^(?:[0-9]+\.){3}[0-9]+$",
+)))
+
+# On-disk cache of validated schemas, shared by generator processes
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
+# In-process cache of validated schemas, keyed by (resolved path, mtime_ns, size)
+_SCHEMA_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
 
 
 class SchemaValidationError(Exception):
@@ -16,34 +52,123 @@ class SchemaValidationError(Exception):
     pass
 
 
-def validate_field_type(field_name: str, field_def: Dict[str, Any], entity_type: str) -> None:
-    """Validate that a field has a supported type."""
-    if "type" not in field_def:
+def interned_mapping(mapping: Dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only copy of a str -> str mapping with interned values."""
+    return MappingProxyType({key: sys.intern(value) for key, value in mapping.items()})
+
+
+@lru_cache(maxsize=2048)
+def pascal_case(name: str) -> str:
+    """Convert snake_case or SCREAMING_SNAKE_CASE to PascalCase."""
+    return ''.join(word.capitalize() for word in name.split('_'))
+
+
+@dataclass(frozen=True, slots=True)
+class NormField:
+    """
+    Language-agnostic, hashable description of a field's type and constraints.
+    
+    Built once per field by normalize_field() and shared by all language
+    emitters, which can memoize on it directly. Absent constraints are None.
+    min/max are kept in their literal form ('0' vs '0.0'): 0 == 0.0 would
+    otherwise make memoized emitters reuse output across int and float bounds.
+    """
+    base_type: str
+    is_array: bool
+    enum: Optional[Tuple[str, ...]]
+    regex_kind: Optional[str]  # 'ipv4', 'email', 'url' or 'other'
+    regex_pattern: Optional[str]
+    minimum: Optional[str]
+    maximum: Optional[str]
+    
+    @property
+    def has_constraints(self) -> bool:
+        """Whether the field carries any enum, regex or min/max constraint."""
+        return not (
+            self.enum is None
+            and self.regex_pattern is None
+            and self.minimum is None
+            and self.maximum is None
+        )
+    
+    @property
+    def yaml_type(self) -> str:
+        """The field type as written in the schema (e.g. 'string[]')."""
+        return f"{self.base_type}[]" if self.is_array else self.base_type
+
+
+@dataclass
+class NormalizedEntities:
+    """
+    Language-agnostic view of one schema section (nodes or edges).
+    
+    Data is stored as parallel lists: index i describes entity i, and the
+    field_* lists hold one inner list per entity with one value per field.
+    """
+    names: List[str] = field(default_factory=list)
+    class_names: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    field_names: List[List[str]] = field(default_factory=list)
+    field_specs: List[List[NormField]] = field(default_factory=list)
+    field_descriptions: List[List[str]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def fields(self, index: int) -> Iterator[Tuple[str, NormField, str]]:
+        """Iterate (name, spec, description) for each field of entity `index`."""
+        return zip(
+            self.field_names[index],
+            self.field_specs[index],
+            self.field_descriptions[index],
+        )
+
+
+@dataclass
+class NormalizedSchema:
+    """Normalized nodes and edges of a validated schema, plus its relationships."""
+    version: int
+    nodes: NormalizedEntities
+    edges: NormalizedEntities
+    relationships: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def load_yaml(stream: Union[str, bytes, IO[str], IO[bytes]]) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_Loader)
+
+
+def _validate_field(field_name: str, field_def: Dict[str, Any], entity_type: str) -> None:
+    """Validate a field's type and its constraints in a single pass."""
+    if field_name in RESERVED_FIELD_NAMES:
         raise SchemaValidationError(
-            f"Field '{field_name}' in {entity_type} must have a 'type' property"
+            f"Field '{field_name}' in {entity_type} uses a reserved name. "
+            f"Reserved field names: {', '.join(sorted(RESERVED_FIELD_NAMES))}"
         )
     
-    field_type = field_def["type"]
+    field_type = field_def.get("type")
+    if field_type is None:
+        raise SchemaValidationError(
+            f"Field '{field_name}' in {entity_type} must have a 'type' property"
+        )
     
     # Check for array types
-    if field_type.endswith("[]"):
-        base_type = field_type[:-2]
-        if base_type not in SUPPORTED_PRIMITIVE_TYPES:
+    is_array = field_type.endswith("[]")
+    base_type = field_type[:-2] if is_array else field_type
+    if base_type not in SUPPORTED_PRIMITIVE_TYPES:
+        if is_array:
             raise SchemaValidationError(
                 f"Field '{field_name}' in {entity_type} has unsupported array base type '{base_type}'. "
-                f"Supported types: {', '.join(SUPPORTED_PRIMITIVE_TYPES)}"
+                f"Supported types: {_SUPPORTED_TYPES_STR}"
             )
-    elif field_type not in SUPPORTED_PRIMITIVE_TYPES:
         raise SchemaValidationError(
             f"Field '{field_name}' in {entity_type} has unsupported type '{field_type}'. "
-            f"Supported types: {', '.join(SUPPORTED_PRIMITIVE_TYPES)} and arrays of these (e.g., 'string[]')"
+            f"Supported types: {_SUPPORTED_TYPES_STR} and arrays of these (e.g., 'string[]')"
         )
-
-
-def validate_field_constraints(field_name: str, field_def: Dict[str, Any], entity_type: str) -> None:
-    """Validate field validation constraints are appropriate for the field type."""
-    field_type = field_def.get("type", "")
-    base_type = field_type.rstrip("[]")
+    
+    enum_values = field_def.get("enum")
+    has_min = "min" in field_def
+    has_max = "max" in field_def
     
     # Validate enum constraints
     if "enum" in field_def:
@@ -52,7 +177,6 @@ def validate_field_constraints(field_name: str, field_def: Dict[str, Any], entit
                 f"Field '{field_name}' in {entity_type} has 'enum' constraint but type is '{field_type}'. "
                 f"Enum constraints are only valid for 'string' type."
             )
-        enum_values = field_def["enum"]
         if not isinstance(enum_values, list) or len(enum_values) == 0:
             raise SchemaValidationError(
                 f"Field '{field_name}' in {entity_type} has invalid 'enum' constraint. "
@@ -60,23 +184,22 @@ def validate_field_constraints(field_name: str, field_def: Dict[str, Any], entit
             )
     
     # Validate regex constraints
-    if "regex" in field_def:
-        if base_type != "string":
-            raise SchemaValidationError(
-                f"Field '{field_name}' in {entity_type} has 'regex' constraint but type is '{field_type}'. "
-                f"Regex constraints are only valid for 'string' type."
-            )
+    if "regex" in field_def and base_type != "string":
+        raise SchemaValidationError(
+            f"Field '{field_name}' in {entity_type} has 'regex' constraint but type is '{field_type}'. "
+            f"Regex constraints are only valid for 'string' type."
+        )
     
     # Validate min/max constraints
-    if "min" in field_def or "max" in field_def:
-        if base_type not in ["int", "float", "timestamp"]:
+    if has_min or has_max:
+        if base_type not in _NUMERIC_TYPES:
             raise SchemaValidationError(
                 f"Field '{field_name}' in {entity_type} has min/max constraint but type is '{field_type}'. "
                 f"Min/max constraints are only valid for numeric types (int, float, timestamp)."
             )
         
         # Validate min <= max
-        if "min" in field_def and "max" in field_def:
+        if has_min and has_max:
             min_val = field_def["min"]
             max_val = field_def["max"]
             if min_val > max_val:
@@ -91,10 +214,11 @@ def validate_relationships(schema: Dict[str, Any]) -> None:
     if "relationships" not in schema:
         return
     
-    nodes = set(schema.get("nodes", {}).keys())
-    edges = set(schema.get("edges", {}).keys())
+    nodes: Set[str] = set(schema.get("nodes", {}).keys())
+    edges: Set[str] = set(schema.get("edges", {}).keys())
+    relationships: List[Dict[str, Any]] = schema["relationships"]
     
-    for i, rel in enumerate(schema["relationships"]):
+    for i, rel in enumerate(relationships):
         if "source" not in rel:
             raise SchemaValidationError(
                 f"Relationship #{i+1} missing 'source' field"
@@ -108,37 +232,85 @@ def validate_relationships(schema: Dict[str, Any]) -> None:
                 f"Relationship #{i+1} missing 'edges' field"
             )
         
-        source = rel["source"]
-        target = rel["target"]
         rel_edges = rel["edges"]
-        
-        if source not in nodes:
-            raise SchemaValidationError(
-                f"Relationship #{i+1} references undefined source node '{source}'"
-            )
-        if target not in nodes:
-            raise SchemaValidationError(
-                f"Relationship #{i+1} references undefined target node '{target}'"
-            )
-        
         if not isinstance(rel_edges, list) or len(rel_edges) == 0:
             raise SchemaValidationError(
                 f"Relationship #{i+1} must have non-empty 'edges' list"
             )
         
-        for edge in rel_edges:
-            if edge not in edges:
-                raise SchemaValidationError(
-                    f"Relationship #{i+1} references undefined edge type '{edge}'"
-                )
+        unknown_edges = set(rel_edges) - edges
+        if unknown_edges:
+            raise SchemaValidationError(
+                f"Relationship #{i+1} references undefined edge types: {sorted(unknown_edges)}"
+            )
+    
+    # Check node references across all relationships at once
+    unknown_sources = {rel["source"] for rel in relationships} - nodes
+    if unknown_sources:
+        raise SchemaValidationError(
+            f"Relationships reference undefined source nodes: {sorted(unknown_sources)}"
+        )
+    
+    unknown_targets = {rel["target"] for rel in relationships} - nodes
+    if unknown_targets:
+        raise SchemaValidationError(
+            f"Relationships reference undefined target nodes: {sorted(unknown_targets)}"
+        )
+
+
+@lru_cache(maxsize=None)
+def _validator_fingerprint() -> bytes:
+    """Digest of this module's source, so cached results expire when validation rules change."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def schema_cache_path(schema_bytes: bytes) -> Path:
+    """Return the on-disk cache file for the given raw schema contents."""
+    digest = hashlib.blake2b(schema_bytes, key=_validator_fingerprint()).hexdigest()
+    return CACHE_DIR / f"schema_{digest}.pkl"
+
+
+def _load_cached_schema(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a previously validated schema from disk, or None if unavailable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            schema = pickle.load(f)
+    except Exception:
+        # Purely a cache: any unreadable or corrupt entry is a miss and gets re-validated
+        return None
+    return schema if isinstance(schema, dict) else None
+
+
+def _store_cached_schema(cache_path: Path, schema: Dict[str, Any]) -> None:
+    """Atomically write a validated schema to the on-disk cache."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(schema, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
-def validate_schema(schema_path: Path) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _resolved_path(schema_path: Path) -> str:
+    """Resolve a schema path once per process for use in cache keys."""
+    return str(schema_path.resolve())
+
+
+def validate_schema(schema_path: Path, emit_cache: bool = False) -> Dict[str, Any]:
     """
     Validate a YAML schema file.
     
+    Results are cached in-process by file path, mtime and size, and read from
+    the on-disk cache (keyed by schema contents) when one has been emitted.
+    Callers always receive their own copy of the schema.
+    
     Args:
         schema_path: Path to entities.yml file
+        emit_cache: Also write the validated schema to the on-disk cache
         
     Returns:
         Parsed schema dictionary
@@ -146,12 +318,34 @@ def validate_schema(schema_path: Path) -> Dict[str, Any]:
     Raises:
         SchemaValidationError: If schema is invalid
     """
-    if not schema_path.exists():
+    try:
+        st = schema_path.stat()
+    except FileNotFoundError:
         raise SchemaValidationError(f"Schema file not found: {schema_path}")
     
+    key = (_resolved_path(schema_path), st.st_mtime_ns, st.st_size)
+    schema = _SCHEMA_CACHE.get(key)
+    
+    if schema is None:
+        try:
+            schema_bytes = schema_path.read_bytes()
+        except FileNotFoundError:
+            raise SchemaValidationError(f"Schema file not found: {schema_path}")
+        cache_path = schema_cache_path(schema_bytes)
+        schema = _load_cached_schema(cache_path)
+        if schema is None:
+            schema = _parse_and_validate(schema_bytes)
+            if emit_cache:
+                _store_cached_schema(cache_path, schema)
+        _SCHEMA_CACHE[key] = schema
+    
+    return copy.deepcopy(schema)
+
+
+def _parse_and_validate(schema_bytes: bytes) -> Dict[str, Any]:
+    """Parse raw schema contents and run all validation checks."""
     try:
-        with open(schema_path, 'r') as f:
-            schema = yaml.safe_load(f)
+        schema = load_yaml(schema_bytes)
     except yaml.YAMLError as e:
         raise SchemaValidationError(f"Invalid YAML syntax: {e}")
     
@@ -185,8 +379,7 @@ def validate_schema(schema_path: Path) -> Dict[str, Any]:
                     raise SchemaValidationError(
                         f"Field '{field_name}' in node '{node_name}' must be a dictionary"
                     )
-                validate_field_type(field_name, field_def, f"node '{node_name}'")
-                validate_field_constraints(field_name, field_def, f"node '{node_name}'")
+                _validate_field(field_name, field_def, f"node '{node_name}'")
     
     # Validate edges section
     if "edges" in schema:
@@ -208,8 +401,7 @@ def validate_schema(schema_path: Path) -> Dict[str, Any]:
                     raise SchemaValidationError(
                         f"Field '{field_name}' in edge '{edge_name}' must be a dictionary"
                     )
-                validate_field_type(field_name, field_def, f"edge '{edge_name}'")
-                validate_field_constraints(field_name, field_def, f"edge '{edge_name}'")
+                _validate_field(field_name, field_def, f"edge '{edge_name}'")
     
     # Validate relationships
     validate_relationships(schema)
@@ -217,17 +409,121 @@ def validate_schema(schema_path: Path) -> Dict[str, Any]:
     return schema
 
 
+@lru_cache(maxsize=256)
+def is_ipv4_regex(regex: str) -> bool:
+    """Check if regex pattern matches IPv4."""
+    # Only collapse doubled backslashes when there are any to collapse
+    normalized = regex.replace("\\\\", "\\") if "\\\\" in regex else regex
+    return IPV4_PATTERN.search(normalized) is not None
+
+
+def _regex_kind(regex: str) -> str:
+    """Classify a regex constraint as 'ipv4', 'email', 'url' or 'other'."""
+    if is_ipv4_regex(regex):
+        return "ipv4"
+    if "email" in regex.lower():
+        return "email"
+    if regex.startswith("^https?://"):
+        return "url"
+    return "other"
+
+
+def normalize_field(field_def: Dict[str, Any]) -> NormField:
+    """Build the NormField for a validated field definition."""
+    field_type = field_def.get("type", "string")
+    is_array = field_type.endswith("[]")
+    enum = field_def.get("enum")
+    regex = field_def.get("regex")
+    minimum = field_def.get("min")
+    maximum = field_def.get("max")
+    
+    return NormField(
+        base_type=field_type[:-2] if is_array else field_type,
+        is_array=is_array,
+        enum=tuple(enum) if enum is not None else None,
+        regex_kind=_regex_kind(regex) if regex is not None else None,
+        regex_pattern=regex,
+        minimum=None if minimum is None else str(minimum),
+        maximum=None if maximum is None else str(maximum),
+    )
+
+
+def _normalize_entities(entities: Dict[str, Dict[str, Any]], pascal_case_names: bool) -> NormalizedEntities:
+    """Flatten one schema section into a NormalizedEntities table."""
+    result = NormalizedEntities()
+    
+    for entity_name, entity_def in entities.items():
+        result.names.append(entity_name)
+        result.class_names.append(pascal_case(entity_name) if pascal_case_names else entity_name)
+        result.descriptions.append(entity_def.get("description", ""))
+        
+        names, specs, descriptions = [], [], []
+        for field_name, field_def in entity_def.get("fields", {}).items():
+            names.append(field_name)
+            specs.append(normalize_field(field_def))
+            descriptions.append(field_def.get("description", ""))
+        
+        result.field_names.append(names)
+        result.field_specs.append(specs)
+        result.field_descriptions.append(descriptions)
+    
+    return result
+
+
+def normalize_schema(schema: Dict[str, Any]) -> NormalizedSchema:
+    """
+    Build the language-agnostic NormalizedSchema for a validated schema.
+    
+    This is the single traversal of nodes/edges that all generators share;
+    each language generator projects it into template data.
+    """
+    return NormalizedSchema(
+        version=schema["version"],
+        nodes=_normalize_entities(schema.get("nodes", {}), pascal_case_names=False),
+        edges=_normalize_entities(schema.get("edges", {}), pascal_case_names=True),
+        relationships=schema.get("relationships", []),
+    )
+
+
+def _load_compiled_build() -> None:
+    """
+    Swap in the optional mypyc build (see setup_mypyc.py) if it is current.
+    
+    The extension is a separate 'validator_c' module, so this source is always
+    importable. It is only used while its recorded digest matches this file;
+    after any edit to validator.py the pure-Python definitions stay in effect.
+    """
+    try:
+        compiled = importlib.import_module("validator_c")
+    except ImportError:
+        return
+    
+    if getattr(compiled, "SOURCE_DIGEST", None) != _validator_fingerprint().hex():
+        return
+    
+    globals().update({name: value for name, value in vars(compiled).items() if not name.startswith("__")})
+
+
+if __name__ != "validator_c":
+    _load_compiled_build()
+
+
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) != 2:
-        print("Usage: python validator.py <path-to-entities.yml>")
+    args = sys.argv[1:]
+    emit_cache = "--emit-cache" in args
+    if emit_cache:
+        args.remove("--emit-cache")
+    
+    if len(args) != 1:
+        print("Usage: python validator.py [--emit-cache] <path-to-entities.yml>")
         sys.exit(1)
     
-    schema_path = Path(sys.argv[1])
+    schema_path = Path(args[0])
     
     try:
-        schema = validate_schema(schema_path)
+        schema = validate_schema(schema_path, emit_cache=emit_cache)
         print(f"✓ Schema validation passed for version {schema['version']}")
         print(f"  - {len(schema.get('nodes', {}))} node types")
         print(f"  - {len(schema.get('edges', {}))} edge types")
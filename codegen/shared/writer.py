@@ -0,0 +1,96 @@
+"""
+Output helpers for pentagi-taxonomy code generators.
+Generated files are only rewritten when their contents change, so unchanged
+outputs keep their mtime and do not trigger downstream rebuilds.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from jinja2 import Template
+
+
+# Rendered output is kept in memory up to this size before spilling to disk
+SPOOL_MAX_SIZE = 1 << 20
+
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _new_hasher():
+    """Return the hasher used to compare generated files."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _file_digest(path: Path) -> Optional[bytes]:
+    """Return the content digest of an existing file, or None if it does not exist."""
+    hasher = _new_hasher()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                hasher.update(block)
+    except FileNotFoundError:
+        return None
+    return hasher.digest()
+
+
+def write_chunks_if_changed(path: Path, chunks: Iterable[str]) -> bool:
+    """
+    Write streamed text to path unless the file already holds identical contents.
+
+    Chunks are encoded as UTF-8 and hashed while being spooled to a temporary
+    buffer, so the full output is never built as a single string. When the
+    contents differ, the buffer is copied to a temporary file in the same
+    directory and moved into place with os.replace, so readers never observe
+    a partially written file.
+
+    Args:
+        path: Destination file
+        chunks: Text fragments making up the new contents
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    hasher = _new_hasher()
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            hasher.update(data)
+            spool.write(data)
+
+        existing_digest = _file_digest(path)
+        if existing_digest == hasher.digest():
+            return False
+
+        spool.seek(0)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(spool, f)
+            if existing_digest is not None:
+                os.chmod(tmp_name, path.stat().st_mode & 0o777)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_name, 0o666 & ~umask)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    return True
+
+
+def render_if_changed(path: Path, template: Template, **context: Any) -> bool:
+    """Stream a rendered template to path unless the file already holds identical contents."""
+    return write_chunks_if_changed(path, template.generate(**context))
+
+
+def format_write_summary(results: list) -> str:
+    """Summarize a list of write results for console output."""
+    written = sum(1 for result in results if result)
+    return f"{written} files written, {len(results) - written} unchanged"
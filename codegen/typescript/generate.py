@@ -6,182 +6,179 @@ Generates Zod schemas and TypeScript types from YAML entity definitions using Ji
 
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
-from jinja2 import Environment, FileSystemLoader
 
 
 # Add shared validator to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
-from validator import validate_schema, SchemaValidationError
+from validator import validate_schema, interned_mapping, normalize_schema, NormalizedEntities, NormalizedSchema, NormField, SchemaValidationError
+from jinja_env import get_env
+from writer import format_write_summary, render_if_changed
+
+
+# TypeScript types for each YAML primitive type
+TS_TYPE_MAP = interned_mapping({
+    "string": "string",
+    "int": "number",
+    "float": "number",
+    "boolean": "boolean",
+    "timestamp": "number",
+})
+
+# Base Zod schemas for each YAML primitive type
+ZOD_TYPE_MAP = interned_mapping({
+    "string": "z.string()",
+    "int": "z.number().int()",
+    "float": "z.number()",
+    "boolean": "z.boolean()",
+    "timestamp": "z.number()",
+})
 
 
 def ts_type_from_yaml(yaml_type: str) -> str:
     """Convert YAML type to TypeScript type."""
     if yaml_type.endswith("[]"):
-        base_type = yaml_type[:-2]
-        ts_base = ts_type_from_yaml(base_type)
-        return f"{ts_base}[]"
-    
-    type_map = {
-        "string": "string",
-        "int": "number",
-        "float": "number",
-        "boolean": "boolean",
-        "timestamp": "number",
-    }
-    return type_map.get(yaml_type, "string")
+        return sys.intern(TS_TYPE_MAP.get(yaml_type[:-2], "string") + "[]")
+    return TS_TYPE_MAP.get(yaml_type, "string")
 
 
-def zod_schema_from_field(field_def: Dict[str, Any]) -> str:
-    """Generate Zod schema for a field."""
-    yaml_type = field_def.get("type", "string")
-    
-    # Handle arrays
-    if yaml_type.endswith("[]"):
-        base_type = yaml_type[:-2]
-        base_schema = zod_schema_from_field({"type": base_type, **{k: v for k, v in field_def.items() if k != "type"}})
-        return f"z.array({base_schema})"
-    
-    # Base type mapping
-    type_map = {
-        "string": "z.string()",
-        "int": "z.number().int()",
-        "float": "z.number()",
-        "boolean": "z.boolean()",
-        "timestamp": "z.number()",
-    }
-    
-    schema = type_map.get(yaml_type, "z.string()")
+@lru_cache(maxsize=4096)
+def emit_zod(spec: NormField) -> str:
+    """Generate Zod schema for a normalized field."""
+    schema = ZOD_TYPE_MAP.get(spec.base_type, "z.string()")
     
     # Apply enum constraint
-    if "enum" in field_def:
-        enum_values = field_def["enum"]
-        enum_str = ", ".join(json.dumps(v) for v in enum_values)
+    if spec.enum is not None:
+        enum_str = json.dumps(spec.enum, separators=(", ", ": "))[1:-1]
         schema = f"z.enum([{enum_str}])"
     
     # Apply regex constraint
-    if "regex" in field_def and "enum" not in field_def:
-        regex = field_def["regex"]
-        schema = f"z.string().regex(/{regex}/)"
+    if spec.regex_pattern is not None and spec.enum is None:
+        schema = f"z.string().regex(/{spec.regex_pattern}/)"
     
     # Apply min/max constraints
-    if "min" in field_def:
-        schema += f".min({field_def['min']})"
-    if "max" in field_def:
-        schema += f".max({field_def['max']})"
-    
+    if spec.minimum is not None:
+        schema += f".min({spec.minimum})"
+    if spec.maximum is not None:
+        schema += f".max({spec.maximum})"
+    
+    # Constraints apply to the element type of arrays
+    if spec.is_array:
+        return f"z.array({schema})"
     return schema
 
 
-def prepare_field_for_zod(field_name: str, field_def: Dict[str, Any]) -> Dict[str, Any]:
+def prepare_field_for_zod(field_name: str, spec: NormField, description: str) -> Dict[str, Any]:
     """Prepare field data for Zod schema generation."""
     return {
-        "zod_schema": zod_schema_from_field(field_def),
-        "description": field_def.get("description", "")
+        "zod_schema": emit_zod(spec),
+        "description": description
     }
 
 
-def prepare_nodes_data(schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Prepare node data for template rendering."""
-    nodes = {}
-    for node_name, node_def in schema.get("nodes", {}).items():
+def prepare_entities_data(entities: NormalizedEntities) -> Dict[str, Any]:
+    """Prepare node or edge data for template rendering."""
+    result = {}
+    for i, entity_name in enumerate(entities.names):
         fields = {}
-        for field_name, field_def in node_def.get("fields", {}).items():
-            fields[field_name] = prepare_field_for_zod(field_name, field_def)
+        for field_name, spec, description in entities.fields(i):
+            fields[field_name] = prepare_field_for_zod(field_name, spec, description)
         
-        nodes[node_name] = {
-            "description": node_def.get("description", ""),
+        result[entity_name] = {
+            "class_name": entities.class_names[i],
+            "description": entities.descriptions[i],
             "fields": fields
         }
     
-    return nodes
+    return result
 
 
-def prepare_edges_data(schema: Dict[str, Any]) -> Dict[str, Any]:
+def prepare_nodes_data(normalized: NormalizedSchema) -> Dict[str, Any]:
+    """Prepare node data for template rendering."""
+    return prepare_entities_data(normalized.nodes)
+
+
+def prepare_edges_data(normalized: NormalizedSchema) -> Dict[str, Any]:
     """Prepare edge data for template rendering."""
-    edges = {}
-    for edge_name, edge_def in schema.get("edges", {}).items():
-        # Convert SCREAMING_SNAKE_CASE to PascalCase
-        class_name = ''.join(word.capitalize() for word in edge_name.split('_'))
-        
-        fields = {}
-        for field_name, field_def in edge_def.get("fields", {}).items():
-            fields[field_name] = prepare_field_for_zod(field_name, field_def)
-        
-        edges[edge_name] = {
-            "class_name": class_name,
-            "description": edge_def.get("description", ""),
-            "fields": fields
-        }
-    
-    return edges
+    return prepare_entities_data(normalized.edges)
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python generate.py <version>")
-        print("Example: python generate.py 2")
-        sys.exit(1)
+def generate(normalized: NormalizedSchema, version_dir: Path, templates_dir: Path) -> None:
+    """
+    Generate the TypeScript package for an already-validated schema.
     
-    version_arg = sys.argv[1]
-    
-    # Determine paths
-    codegen_dir = Path(__file__).parent.parent.parent
-    version_dir = codegen_dir / f"v{version_arg}"
-    schema_path = version_dir / "entities.yml"
+    Args:
+        normalized: Normalized view of the validated schema
+        version_dir: Version directory (e.g. v2/) the output is written under
+        templates_dir: Directory containing the TypeScript templates
+    """
+    schema_version = normalized.version
     output_dir = version_dir / "typescript"
     src_dir = output_dir / "src"
-    templates_dir = codegen_dir / "codegen" / "templates" / "typescript"
     
-    print(f"Generating TypeScript code for version {version_arg}...")
-    print(f"  Schema: {schema_path}")
+    print(f"Generating TypeScript code for version {schema_version}...")
     print(f"  Output: {output_dir}")
     
-    # Validate schema
-    try:
-        schema = validate_schema(schema_path)
-    except SchemaValidationError as e:
-        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
-        sys.exit(1)
-    
-    schema_version = schema.get("version", int(version_arg))
-    
     # Create output directories
     src_dir.mkdir(parents=True, exist_ok=True)
     
     # Setup Jinja2 environment
-    env = Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+    env = get_env(str(templates_dir))
     
     # Prepare data for templates
-    nodes_data = prepare_nodes_data(schema)
-    edges_data = prepare_edges_data(schema)
+    nodes_data = prepare_nodes_data(normalized)
+    edges_data = prepare_edges_data(normalized)
+    
+    # Generate files (unchanged outputs are left untouched)
+    written = []
     
-    # Generate files
     print("  Generating package.json...")
     package_template = env.get_template("package.json.j2")
-    package_json = package_template.render(version=schema_version)
-    (output_dir / "package.json").write_text(package_json)
+    written.append(render_if_changed(output_dir / "package.json", package_template, version=schema_version))
     
     print("  Generating tsconfig.json...")
     tsconfig_template = env.get_template("tsconfig.json.j2")
-    tsconfig = tsconfig_template.render()
-    (output_dir / "tsconfig.json").write_text(tsconfig)
+    written.append(render_if_changed(output_dir / "tsconfig.json", tsconfig_template))
     
     print("  Generating src/schemas.ts...")
     schemas_template = env.get_template("schemas.ts.j2")
-    schemas_content = schemas_template.render(nodes=nodes_data, edges=edges_data)
-    (src_dir / "schemas.ts").write_text(schemas_content)
+    written.append(render_if_changed(src_dir / "schemas.ts", schemas_template, nodes=nodes_data, edges=edges_data))
     
     print("  Generating src/index.ts...")
     index_template = env.get_template("index.ts.j2")
-    index_content = index_template.render(version=schema_version)
-    (src_dir / "index.ts").write_text(index_content)
+    written.append(render_if_changed(src_dir / "index.ts", index_template, version=schema_version))
     
     print(f"✓ TypeScript code generation complete!")
+    print(f"  {format_write_summary(written)}")
     print(f"  Generated {len(nodes_data)} node schemas")
     print(f"  Generated {len(edges_data)} edge schemas")
 
 
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python generate.py <version>")
+        print("Example: python generate.py 2")
+        sys.exit(1)
+    
+    version_arg = sys.argv[1]
+    
+    # Determine paths
+    repo_dir = Path(__file__).resolve().parent.parent.parent
+    version_dir = repo_dir / f"v{version_arg}"
+    schema_path = version_dir / "entities.yml"
+    templates_dir = repo_dir / "codegen" / "templates" / "typescript"
+    
+    # Validate schema
+    try:
+        schema = validate_schema(schema_path)
+    except SchemaValidationError as e:
+        print(f"✗ Schema validation failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    generate(normalize_schema(schema), version_dir, templates_dir)
+
+
 if __name__ == "__main__":
     main()
@@ -9,6 +9,7 @@ print("=" * 60)
 
 from pentagi_taxonomy import TAXONOMY_VERSION
 from pentagi_taxonomy.nodes import Target, Port
+from pentagi_taxonomy.entity_map import PORT_LIST_ADAPTER
 from pentagi_taxonomy.edges import HasPort, Discovered
 
 print(f"\n✓ Successfully imported from pentagi_taxonomy v{TAXONOMY_VERSION}")
@@ -16,7 +17,7 @@ print(f"\n✓ Successfully imported from pentagi_taxonomy v{TAXONOMY_VERSION}")
 # Test creating a Target entity (v1 only has active/inactive status)
 target = Target(
     version=1,
-    uuid="target-123",
+    entity_uuid="target-123",
     hostname="example.com",
     ip_address="192.168.1.1",
     target_type="host",
@@ -24,7 +25,7 @@ target = Target(
     risk_score=7.5
 )
 print(f"\n✓ Created Target entity:")
-print(f"  UUID: {target.uuid}")
+print(f"  UUID: {target.entity_uuid}")
 print(f"  Hostname: {target.hostname}")
 print(f"  IP Address: {target.ip_address}")
 print(f"  Target Type: {target.target_type}")
@@ -34,25 +35,34 @@ print(f"  Risk Score: {target.risk_score}")
 # Test creating a Port entity (v1 doesn't have service field)
 port = Port(
     version=1,
-    uuid="port-456",
+    entity_uuid="port-456",
     port_number=443,
     protocol="tcp",
     state="open"
 )
 print(f"\n✓ Created Port entity:")
-print(f"  UUID: {port.uuid}")
+print(f"  UUID: {port.entity_uuid}")
 print(f"  Port Number: {port.port_number}")
 print(f"  Protocol: {port.protocol}")
 print(f"  State: {port.state}")
 
+# Test batch-validating Ports as one list (as a scan importer would)
+rows = [
+    {"version": 1, "port_number": number, "protocol": "tcp", "state": "open"}
+    for number in (22, 80, 443)
+]
+ports = PORT_LIST_ADAPTER.validate_python(rows)
+print(f"\n✓ Batch-validated {len(ports)} Port entities:")
+print(f"  Port Numbers: {[p.port_number for p in ports]}")
+
 # Test creating edge relationships
-has_port = HasPort(version=1, timestamp=1634567890.5)
+has_port = HasPort(version=1, timestamp=1634567890_500_000)
 print(f"\n✓ Created HAS_PORT edge:")
 print(f"  Timestamp: {has_port.timestamp}")
 
 discovered = Discovered(
     version=1,
-    timestamp=1634567900.0,
+    timestamp=1634567900_000_000,
     confidence=0.95,
     method="active"
 )
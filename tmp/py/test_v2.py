@@ -9,6 +9,7 @@ print("=" * 60)
 
 from pentagi_taxonomy import TAXONOMY_VERSION
 from pentagi_taxonomy.nodes import Target, Port, Vulnerability
+from pentagi_taxonomy.entity_map import PORT_LIST_ADAPTER
 from pentagi_taxonomy.edges import HasPort, Affects, Discovered
 
 print(f"\n✓ Successfully imported from pentagi_taxonomy v{TAXONOMY_VERSION}")
@@ -16,16 +17,16 @@ print(f"\n✓ Successfully imported from pentagi_taxonomy v{TAXONOMY_VERSION}")
 # Test creating a Target entity (v2 has additional fields like discovered_at)
 target = Target(
     version=2,
-    uuid="target-123",
+    entity_uuid="target-123",
     hostname="example.com",
     ip_address="192.168.1.1",
     target_type="host",
     status="active",
     risk_score=7.5,
-    discovered_at=1634567800.0
+    discovered_at=1634567800_000_000
 )
 print(f"\n✓ Created Target entity:")
-print(f"  UUID: {target.uuid}")
+print(f"  UUID: {target.entity_uuid}")
 print(f"  Hostname: {target.hostname}")
 print(f"  IP Address: {target.ip_address}")
 print(f"  Target Type: {target.target_type}")
@@ -36,32 +37,41 @@ print(f"  Discovered At: {target.discovered_at}")
 # Test creating a Port entity (v2 has discovered_at field)
 port = Port(
     version=2,
-    uuid="port-456",
+    entity_uuid="port-456",
     port_number=443,
     protocol="tcp",
     state="open",
-    discovered_at=1634567850.0
+    discovered_at=1634567850_000_000
 )
 print(f"\n✓ Created Port entity:")
-print(f"  UUID: {port.uuid}")
+print(f"  UUID: {port.entity_uuid}")
 print(f"  Port Number: {port.port_number}")
 print(f"  Protocol: {port.protocol}")
 print(f"  State: {port.state}")
 print(f"  Discovered At: {port.discovered_at}")
 
+# Test batch-validating Ports as one list (as a scan importer would)
+rows = [
+    {"version": 2, "port_number": number, "protocol": "tcp", "state": "open"}
+    for number in (22, 80, 443)
+]
+ports = PORT_LIST_ADAPTER.validate_python(rows)
+print(f"\n✓ Batch-validated {len(ports)} Port entities:")
+print(f"  Port Numbers: {[p.port_number for p in ports]}")
+
 # Test creating a Vulnerability entity (NEW in v2!)
 vulnerability = Vulnerability(
     version=2,
-    uuid="vuln-789",
+    entity_uuid="vuln-789",
     vuln_id="CVE-2024-1234",
     title="SQL Injection",
     severity="critical",
     cvss_score=9.8,
     exploitable=True,
-    discovered_at=1634567900.0
+    discovered_at=1634567900_000_000
 )
 print(f"\n✓ Created Vulnerability entity (NEW in v2):")
-print(f"  UUID: {vulnerability.uuid}")
+print(f"  UUID: {vulnerability.entity_uuid}")
 print(f"  Vuln ID: {vulnerability.vuln_id}")
 print(f"  Title: {vulnerability.title}")
 print(f"  Severity: {vulnerability.severity}")
@@ -70,13 +80,13 @@ print(f"  Exploitable: {vulnerability.exploitable}")
 print(f"  Discovered At: {vulnerability.discovered_at}")
 
 # Test creating edge relationships
-has_port = HasPort(version=2, timestamp=1634567890.5)
+has_port = HasPort(version=2, timestamp=1634567890_500_000)
 print(f"\n✓ Created HAS_PORT edge:")
 print(f"  Timestamp: {has_port.timestamp}")
 
 affects = Affects(
     version=2,
-    timestamp=1634567900.0,
+    timestamp=1634567900_000_000,
     impact="direct"
 )
 print(f"\n✓ Created AFFECTS edge (NEW in v2):")
@@ -85,7 +95,7 @@ print(f"  Impact: {affects.impact}")
 
 discovered = Discovered(
     version=2,
-    timestamp=1634567950.0,
+    timestamp=1634567950_000_000,
     confidence=0.98,
     method="passive"
 )
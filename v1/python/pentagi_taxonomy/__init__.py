@@ -7,11 +7,13 @@ DO NOT EDIT - this file is generated from entities.yml
 TAXONOMY_VERSION: int = 1
 
 # Re-export entity types for convenience
-from .entity_map import ENTITY_TYPES, EDGE_TYPES, EDGE_TYPE_MAP
+from .entity_map import ENTITY_TYPES, EDGE_TYPES, EDGE_TYPE_MAP, NODE_ADAPTER, EDGE_ADAPTER
 
 __all__ = [
     'TAXONOMY_VERSION',
     'ENTITY_TYPES',
     'EDGE_TYPES',
     'EDGE_TYPE_MAP',
+    'NODE_ADAPTER',
+    'EDGE_ADAPTER',
 ]
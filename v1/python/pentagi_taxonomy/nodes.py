@@ -3,24 +3,130 @@ Auto-generated node models for pentagi-taxonomy.
 DO NOT EDIT - this file is generated from entities.yml
 """
 
-from pydantic import BaseModel, Field
-from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Any, Literal
+
+# Field descriptions, kept out of the core schema and merged into JSON schema on demand
+_FIELD_DOCS: dict[str, dict[str, str]] = {
+    'Target': {
+        'version': 'Taxonomy schema version (auto-injected by Graphiti fork)',
+        'entity_uuid': 'Unique identifier',
+        'hostname': 'DNS hostname if known',
+        'ip_address': 'IP address of the target',
+        'target_type': 'Classification of target',
+        'risk_score': 'Calculated risk score',
+        'status': 'Current status',
+    },
+    'Port': {
+        'version': 'Taxonomy schema version (auto-injected by Graphiti fork)',
+        'entity_uuid': 'Unique identifier',
+        'port_number': 'Port number',
+        'protocol': 'Network protocol',
+        'state': 'Port state',
+    },
+}
+
+
+def _field_docs_for(model: type) -> dict[str, str]:
+    """Return the _FIELD_DOCS entry of the generated model that model is or extends."""
+    # Subclasses (user or legacy) inherit the docs of the generated model they extend
+    for klass in model.__mro__:
+        if klass.__module__ == __name__ and klass.__name__ in _FIELD_DOCS:
+            return _FIELD_DOCS[klass.__name__]
+    return {}
+
+
+def _add_field_docs(schema: dict[str, Any], model: type) -> None:
+    """Restore field descriptions from _FIELD_DOCS into a model's JSON schema."""
+    properties = schema.get("properties", {})
+    for field_name, description in _field_docs_for(model).items():
+        if field_name in properties:
+            properties[field_name]["description"] = description
+
 
 class Target(BaseModel):
     """A target system being assessed during penetration testing"""
-    version: int | None = Field(None, description='Taxonomy schema version (auto-injected by Graphiti fork)')
-    entity_uuid: str | None = Field(None, description='Unique identifier')
-    hostname: str | None = Field(None, description='DNS hostname if known')
-    ip_address: str | None = Field(None, description='IP address of the target')
-    target_type: Literal['host', 'web_service', 'api'] | None = Field(None, description='Classification of target')
-    risk_score: float | None = Field(None, description='Calculated risk score', ge=0.0, le=10.0)
-    status: Literal['active', 'inactive'] | None = Field(None, description='Current status')
+    model_config = ConfigDict(extra='forbid', json_schema_extra=_add_field_docs)
+
+    type: Literal['Target'] = 'Target'
+    version: int | None = Field(None)
+    entity_uuid: str | None = Field(None)
+    hostname: str | None = Field(None)
+    ip_address: str | None = Field(None)
+    target_type: Literal['host', 'web_service', 'api'] | None = Field(None)
+    risk_score: float | None = Field(None, ge=0.0, le=10.0)
+    status: Literal['active', 'inactive'] | None = Field(None)
+
+    @classmethod
+    def from_trusted(
+        _cls,
+        *,
+        version: int | None = None,
+        entity_uuid: str | None = None,
+        hostname: str | None = None,
+        ip_address: str | None = None,
+        target_type: Literal['host', 'web_service', 'api'] | None = None,
+        risk_score: float | None = None,
+        status: Literal['active', 'inactive'] | None = None,
+    ) -> 'Target':
+        """Build a Target from trusted values, skipping validation entirely."""
+        _instance = object.__new__(_cls)
+        _values = {
+            'type': 'Target',
+            'version': version,
+            'entity_uuid': entity_uuid,
+            'hostname': hostname,
+            'ip_address': ip_address,
+            'target_type': target_type,
+            'risk_score': risk_score,
+            'status': status,
+        }
+        object.__setattr__(_instance, '__dict__', _values)
+        object.__setattr__(_instance, '__pydantic_fields_set__', {
+            _name for _name, _value in _values.items() if _value is not None and _name != 'type'
+        })
+        object.__setattr__(_instance, '__pydantic_extra__', None)
+        object.__setattr__(_instance, '__pydantic_private__', None)
+        return _instance
+
 
 class Port(BaseModel):
     """A network port on a target system"""
-    version: int | None = Field(None, description='Taxonomy schema version (auto-injected by Graphiti fork)')
-    entity_uuid: str | None = Field(None, description='Unique identifier')
-    port_number: int | None = Field(None, description='Port number', ge=1, le=65535)
-    protocol: Literal['tcp', 'udp'] | None = Field(None, description='Network protocol')
-    state: Literal['open', 'closed', 'filtered'] | None = Field(None, description='Port state')
+    model_config = ConfigDict(extra='forbid', json_schema_extra=_add_field_docs)
+
+    type: Literal['Port'] = 'Port'
+    version: int | None = Field(None)
+    entity_uuid: str | None = Field(None)
+    port_number: int | None = Field(None, ge=1, le=65535)
+    protocol: Literal['tcp', 'udp'] | None = Field(None)
+    state: Literal['open', 'closed', 'filtered'] | None = Field(None)
+
+    @classmethod
+    def from_trusted(
+        _cls,
+        *,
+        version: int | None = None,
+        entity_uuid: str | None = None,
+        port_number: int | None = None,
+        protocol: Literal['tcp', 'udp'] | None = None,
+        state: Literal['open', 'closed', 'filtered'] | None = None,
+    ) -> 'Port':
+        """Build a Port from trusted values, skipping validation entirely."""
+        _instance = object.__new__(_cls)
+        _values = {
+            'type': 'Port',
+            'version': version,
+            'entity_uuid': entity_uuid,
+            'port_number': port_number,
+            'protocol': protocol,
+            'state': state,
+        }
+        object.__setattr__(_instance, '__dict__', _values)
+        object.__setattr__(_instance, '__pydantic_fields_set__', {
+            _name for _name, _value in _values.items() if _value is not None and _name != 'type'
+        })
+        object.__setattr__(_instance, '__pydantic_extra__', None)
+        object.__setattr__(_instance, '__pydantic_private__', None)
+        return _instance
+
 
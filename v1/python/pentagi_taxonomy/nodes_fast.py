@@ -0,0 +1,38 @@
+"""
+Auto-generated msgspec twins of the node models for pentagi-taxonomy.
+DO NOT EDIT - this file is generated from entities.yml
+
+Requires the optional msgspec dependency (pip install pentagi-taxonomy[fast]).
+These structs produce the same JSON shape as the Pydantic models, including the
+'type' tag, and check types on decode, but do not enforce min/max
+constraints: keep pentagi_taxonomy.nodes as the validating boundary.
+"""
+
+from typing import Literal, Union
+
+import msgspec
+
+
+class Target(msgspec.Struct, kw_only=True, tag_field='type', tag='Target'):
+    """A target system being assessed during penetration testing"""
+    version: int | None = None
+    entity_uuid: str | None = None
+    hostname: str | None = None
+    ip_address: str | None = None
+    target_type: Literal['host', 'web_service', 'api'] | None = None
+    risk_score: float | None = None
+    status: Literal['active', 'inactive'] | None = None
+
+class Port(msgspec.Struct, kw_only=True, tag_field='type', tag='Port'):
+    """A network port on a target system"""
+    version: int | None = None
+    entity_uuid: str | None = None
+    port_number: int | None = None
+    protocol: Literal['tcp', 'udp'] | None = None
+    state: Literal['open', 'closed', 'filtered'] | None = None
+
+
+ENCODER = msgspec.json.Encoder()
+TARGET_DECODER = msgspec.json.Decoder(Target)
+PORT_DECODER = msgspec.json.Decoder(Port)
+NODE_DECODER = msgspec.json.Decoder(Union[Target, Port])
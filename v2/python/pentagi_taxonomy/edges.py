@@ -3,24 +3,145 @@ Auto-generated edge models for pentagi-taxonomy.
 DO NOT EDIT - this file is generated from entities.yml
 """
 
-from pydantic import BaseModel, Field
-from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Any, Literal
+
+# Field descriptions, kept out of the core schema and merged into JSON schema on demand
+_FIELD_DOCS: dict[str, dict[str, str]] = {
+    'HasPort': {
+        'version': 'Taxonomy schema version (auto-injected by Graphiti fork)',
+        'timestamp': 'When association was established',
+    },
+    'Discovered': {
+        'version': 'Taxonomy schema version (auto-injected by Graphiti fork)',
+        'timestamp': 'Discovery timestamp',
+        'confidence': 'Confidence score',
+        'method': 'Discovery method',
+    },
+    'Affects': {
+        'version': 'Taxonomy schema version (auto-injected by Graphiti fork)',
+        'timestamp': 'When the relationship was identified',
+        'impact': 'Type of impact',
+    },
+}
+
+
+def _field_docs_for(model: type) -> dict[str, str]:
+    """Return the _FIELD_DOCS entry of the generated model that model is or extends."""
+    # Subclasses (user or legacy) inherit the docs of the generated model they extend
+    for klass in model.__mro__:
+        if klass.__module__ == __name__ and klass.__name__ in _FIELD_DOCS:
+            return _FIELD_DOCS[klass.__name__]
+    return {}
+
+
+def _add_field_docs(schema: dict[str, Any], model: type) -> None:
+    """Restore field descriptions from _FIELD_DOCS into a model's JSON schema."""
+    properties = schema.get("properties", {})
+    for field_name, description in _field_docs_for(model).items():
+        if field_name in properties:
+            properties[field_name]["description"] = description
+
 
 class HasPort(BaseModel):
     """A target has a port"""
-    version: int | None = Field(None, description='Taxonomy schema version (auto-injected by Graphiti fork)')
-    timestamp: float | None = Field(None, description='When association was established')
+    model_config = ConfigDict(extra='forbid', json_schema_extra=_add_field_docs)
+
+    type: Literal['HAS_PORT'] = 'HAS_PORT'
+    version: int | None = Field(None)
+    timestamp: int | None = Field(None, ge=0, strict=True)
+
+    @classmethod
+    def from_trusted(
+        _cls,
+        *,
+        version: int | None = None,
+        timestamp: int | None = None,
+    ) -> 'HasPort':
+        """Build a HasPort from trusted values, skipping validation entirely."""
+        _instance = object.__new__(_cls)
+        _values = {
+            'type': 'HAS_PORT',
+            'version': version,
+            'timestamp': timestamp,
+        }
+        object.__setattr__(_instance, '__dict__', _values)
+        object.__setattr__(_instance, '__pydantic_fields_set__', {
+            _name for _name, _value in _values.items() if _value is not None and _name != 'type'
+        })
+        object.__setattr__(_instance, '__pydantic_extra__', None)
+        object.__setattr__(_instance, '__pydantic_private__', None)
+        return _instance
+
 
 class Discovered(BaseModel):
     """An action discovered an entity"""
-    version: int | None = Field(None, description='Taxonomy schema version (auto-injected by Graphiti fork)')
-    timestamp: float | None = Field(None, description='Discovery timestamp')
-    confidence: float | None = Field(None, description='Confidence score', ge=0.0, le=1.0)
-    method: Literal['active', 'passive'] | None = Field(None, description='Discovery method')
+    model_config = ConfigDict(extra='forbid', json_schema_extra=_add_field_docs)
+
+    type: Literal['DISCOVERED'] = 'DISCOVERED'
+    version: int | None = Field(None)
+    timestamp: int | None = Field(None, ge=0, strict=True)
+    confidence: float | None = Field(None, ge=0.0, le=1.0)
+    method: Literal['active', 'passive'] | None = Field(None)
+
+    @classmethod
+    def from_trusted(
+        _cls,
+        *,
+        version: int | None = None,
+        timestamp: int | None = None,
+        confidence: float | None = None,
+        method: Literal['active', 'passive'] | None = None,
+    ) -> 'Discovered':
+        """Build a Discovered from trusted values, skipping validation entirely."""
+        _instance = object.__new__(_cls)
+        _values = {
+            'type': 'DISCOVERED',
+            'version': version,
+            'timestamp': timestamp,
+            'confidence': confidence,
+            'method': method,
+        }
+        object.__setattr__(_instance, '__dict__', _values)
+        object.__setattr__(_instance, '__pydantic_fields_set__', {
+            _name for _name, _value in _values.items() if _value is not None and _name != 'type'
+        })
+        object.__setattr__(_instance, '__pydantic_extra__', None)
+        object.__setattr__(_instance, '__pydantic_private__', None)
+        return _instance
+
 
 class Affects(BaseModel):
     """A vulnerability affects a target or service"""
-    version: int | None = Field(None, description='Taxonomy schema version (auto-injected by Graphiti fork)')
-    timestamp: float | None = Field(None, description='When the relationship was identified')
-    impact: Literal['direct', 'indirect'] | None = Field(None, description='Type of impact')
+    model_config = ConfigDict(extra='forbid', json_schema_extra=_add_field_docs)
+
+    type: Literal['AFFECTS'] = 'AFFECTS'
+    version: int | None = Field(None)
+    timestamp: int | None = Field(None, ge=0, strict=True)
+    impact: Literal['direct', 'indirect'] | None = Field(None)
+
+    @classmethod
+    def from_trusted(
+        _cls,
+        *,
+        version: int | None = None,
+        timestamp: int | None = None,
+        impact: Literal['direct', 'indirect'] | None = None,
+    ) -> 'Affects':
+        """Build a Affects from trusted values, skipping validation entirely."""
+        _instance = object.__new__(_cls)
+        _values = {
+            'type': 'AFFECTS',
+            'version': version,
+            'timestamp': timestamp,
+            'impact': impact,
+        }
+        object.__setattr__(_instance, '__dict__', _values)
+        object.__setattr__(_instance, '__pydantic_fields_set__', {
+            _name for _name, _value in _values.items() if _value is not None and _name != 'type'
+        })
+        object.__setattr__(_instance, '__pydantic_extra__', None)
+        object.__setattr__(_instance, '__pydantic_private__', None)
+        return _instance
+
 
@@ -0,0 +1,39 @@
+"""
+Auto-generated msgspec twins of the edge models for pentagi-taxonomy.
+DO NOT EDIT - this file is generated from entities.yml
+
+Requires the optional msgspec dependency (pip install pentagi-taxonomy[fast]).
+These structs produce the same JSON shape as the Pydantic models, including the
+'type' tag, and check types on decode, but do not enforce min/max
+constraints: keep pentagi_taxonomy.edges as the validating boundary.
+"""
+
+from typing import Literal, Union
+
+import msgspec
+
+
+class HasPort(msgspec.Struct, kw_only=True, tag_field='type', tag='HAS_PORT'):
+    """A target has a port"""
+    version: int | None = None
+    timestamp: int | None = None
+
+class Discovered(msgspec.Struct, kw_only=True, tag_field='type', tag='DISCOVERED'):
+    """An action discovered an entity"""
+    version: int | None = None
+    timestamp: int | None = None
+    confidence: float | None = None
+    method: Literal['active', 'passive'] | None = None
+
+class Affects(msgspec.Struct, kw_only=True, tag_field='type', tag='AFFECTS'):
+    """A vulnerability affects a target or service"""
+    version: int | None = None
+    timestamp: int | None = None
+    impact: Literal['direct', 'indirect'] | None = None
+
+
+ENCODER = msgspec.json.Encoder()
+HAS_PORT_DECODER = msgspec.json.Decoder(HasPort)
+DISCOVERED_DECODER = msgspec.json.Decoder(Discovered)
+AFFECTS_DECODER = msgspec.json.Decoder(Affects)
+EDGE_DECODER = msgspec.json.Decoder(Union[HasPort, Discovered, Affects])
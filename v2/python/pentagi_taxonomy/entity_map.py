@@ -1,24 +1,162 @@
 """
 Auto-generated entity mappings for pentagi-taxonomy.
 DO NOT EDIT - this file is generated from entities.yml
+
+make_<entity>() helpers validate their input. construct_<entity>() helpers
+skip validation entirely and must only be used for trusted, already-validated
+data (e.g. rows read back from the graph store).
 """
 
+from types import MappingProxyType
+from typing import Annotated, Union
+
+from pydantic import BaseModel, Field, TypeAdapter
+
 from .nodes import Target, Port, Vulnerability
 from .edges import HasPort, Discovered, Affects
+from .nodes import _field_docs_for as _node_field_docs_for
+from .edges import _field_docs_for as _edge_field_docs_for
 
-ENTITY_TYPES = {
+# Read-only lookup tables; values in EDGE_TYPE_MAP are tuples of edge names
+ENTITY_TYPES = MappingProxyType({
     'Target': Target,
     'Port': Port,
     'Vulnerability': Vulnerability,
-}
+})
 
-EDGE_TYPES = {
+EDGE_TYPES = MappingProxyType({
     'HAS_PORT': HasPort,
     'DISCOVERED': Discovered,
     'AFFECTS': Affects,
-}
+})
+
+EDGE_TYPE_MAP = MappingProxyType({
+    ('Target', 'Port'): ('HAS_PORT',),
+    ('Vulnerability', 'Target'): ('AFFECTS',),
+})
+
+# Source class -> target class -> edge names, so dispatch skips building string keys
+_EDGE_TYPES_BY_CLASS = MappingProxyType({
+    Target: MappingProxyType({
+        Port: ('HAS_PORT',),
+    }),
+    Vulnerability: MappingProxyType({
+        Target: ('AFFECTS',),
+    }),
+})
+
+_NO_EDGE_TYPES = MappingProxyType({})
+
+
+def edge_types_for(src_cls: type, tgt_cls: type) -> tuple[str, ...]:
+    """Return the edge names allowed between two node classes (empty if none)."""
+    return _EDGE_TYPES_BY_CLASS.get(src_cls, _NO_EDGE_TYPES).get(tgt_cls, ())
+
 
-EDGE_TYPE_MAP = {
-    ('Target', 'Port'): ['HAS_PORT'],
-    ('Vulnerability', 'Target'): ['AFFECTS'],
+# Validates any node row, dispatching on its 'type' tag
+NodeUnion = Annotated[Union[Target, Port, Vulnerability], Field(discriminator='type')]
+NODE_ADAPTER = TypeAdapter(NodeUnion)
+
+# Validates any edge row, dispatching on its 'type' tag
+EdgeUnion = Annotated[Union[HasPort, Discovered, Affects], Field(discriminator='type')]
+EDGE_ADAPTER = TypeAdapter(EdgeUnion)
+
+# Adapters are built once at import time; use them in bulk loops instead of Model(**row)
+TARGET_ADAPTER = TypeAdapter(Target)
+PORT_ADAPTER = TypeAdapter(Port)
+VULNERABILITY_ADAPTER = TypeAdapter(Vulnerability)
+HAS_PORT_ADAPTER = TypeAdapter(HasPort)
+DISCOVERED_ADAPTER = TypeAdapter(Discovered)
+AFFECTS_ADAPTER = TypeAdapter(Affects)
+
+# Batch adapters validate a whole list[dict] (or JSON array) in one pydantic-core call
+TARGET_LIST_ADAPTER = TypeAdapter(list[Target])
+PORT_LIST_ADAPTER = TypeAdapter(list[Port])
+VULNERABILITY_LIST_ADAPTER = TypeAdapter(list[Vulnerability])
+HAS_PORT_LIST_ADAPTER = TypeAdapter(list[HasPort])
+DISCOVERED_LIST_ADAPTER = TypeAdapter(list[Discovered])
+AFFECTS_LIST_ADAPTER = TypeAdapter(list[Affects])
+
+# Model class -> adapter whose serializer is reused by dump_json()
+SERIALIZERS = {
+    Target: TARGET_ADAPTER,
+    Port: PORT_ADAPTER,
+    Vulnerability: VULNERABILITY_ADAPTER,
+    HasPort: HAS_PORT_ADAPTER,
+    Discovered: DISCOVERED_ADAPTER,
+    Affects: AFFECTS_ADAPTER,
 }
+
+
+def dump_json(obj: BaseModel) -> bytes:
+    """Serialize a node or edge model to compact JSON bytes."""
+    adapter = SERIALIZERS.get(type(obj))
+    if adapter is None:
+        # Subclasses (e.g. pentagi_taxonomy.legacy models) use their own serializer
+        return obj.__pydantic_serializer__.to_json(obj)
+    return adapter.dump_json(obj)
+
+
+def make_target(**kwargs) -> Target:
+    """Build a validated Target from keyword arguments."""
+    return TARGET_ADAPTER.validate_python(kwargs)
+
+
+def make_port(**kwargs) -> Port:
+    """Build a validated Port from keyword arguments."""
+    return PORT_ADAPTER.validate_python(kwargs)
+
+
+def make_vulnerability(**kwargs) -> Vulnerability:
+    """Build a validated Vulnerability from keyword arguments."""
+    return VULNERABILITY_ADAPTER.validate_python(kwargs)
+
+
+def make_has_port(**kwargs) -> HasPort:
+    """Build a validated HasPort from keyword arguments."""
+    return HAS_PORT_ADAPTER.validate_python(kwargs)
+
+
+def make_discovered(**kwargs) -> Discovered:
+    """Build a validated Discovered from keyword arguments."""
+    return DISCOVERED_ADAPTER.validate_python(kwargs)
+
+
+def make_affects(**kwargs) -> Affects:
+    """Build a validated Affects from keyword arguments."""
+    return AFFECTS_ADAPTER.validate_python(kwargs)
+
+
+def construct_target(data: dict) -> Target:
+    """Build a Target from trusted data without validation."""
+    return Target.model_construct(**data)
+
+
+def construct_port(data: dict) -> Port:
+    """Build a Port from trusted data without validation."""
+    return Port.model_construct(**data)
+
+
+def construct_vulnerability(data: dict) -> Vulnerability:
+    """Build a Vulnerability from trusted data without validation."""
+    return Vulnerability.model_construct(**data)
+
+
+def construct_has_port(data: dict) -> HasPort:
+    """Build a HasPort from trusted data without validation."""
+    return HasPort.model_construct(**data)
+
+
+def construct_discovered(data: dict) -> Discovered:
+    """Build a Discovered from trusted data without validation."""
+    return Discovered.model_construct(**data)
+
+
+def construct_affects(data: dict) -> Affects:
+    """Build a Affects from trusted data without validation."""
+    return Affects.model_construct(**data)
+
+
+def get_field_description(cls: type, field_name: str) -> str | None:
+    """Return the schema description of a model field, or None if it has none."""
+    return (_node_field_docs_for(cls) or _edge_field_docs_for(cls)).get(field_name)
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Auto-generated legacy timestamp models for pentagi-taxonomy.
+DO NOT EDIT - this file is generated from entities.yml
+
+Timestamps are integer microseconds since the Unix epoch. The models below
+accept the legacy float-seconds form and convert it on input; use them only
+at boundaries that still receive old data so hot paths keep the pure-int route.
+"""
+
+from typing import Any
+
+from pydantic import field_validator
+
+from . import nodes, edges
+
+
+def _seconds_to_micros(value: Any) -> Any:
+    """Convert legacy Unix seconds (or a list of them) to integer microseconds."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(value * 1_000_000)
+    if isinstance(value, list):
+        return [_seconds_to_micros(item) for item in value]
+    return value
+
+
+class Target(nodes.Target):
+    """Target accepting legacy float-second timestamps."""
+
+    @field_validator('discovered_at', mode='before')
+    @classmethod
+    def timestamps_from_seconds(cls, value: Any) -> Any:
+        return _seconds_to_micros(value)
+
+
+class Port(nodes.Port):
+    """Port accepting legacy float-second timestamps."""
+
+    @field_validator('discovered_at', mode='before')
+    @classmethod
+    def timestamps_from_seconds(cls, value: Any) -> Any:
+        return _seconds_to_micros(value)
+
+
+class Vulnerability(nodes.Vulnerability):
+    """Vulnerability accepting legacy float-second timestamps."""
+
+    @field_validator('discovered_at', mode='before')
+    @classmethod
+    def timestamps_from_seconds(cls, value: Any) -> Any:
+        return _seconds_to_micros(value)
+
+
+class HasPort(edges.HasPort):
+    """HasPort accepting legacy float-second timestamps."""
+
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def timestamps_from_seconds(cls, value: Any) -> Any:
+        return _seconds_to_micros(value)
+
+
+class Discovered(edges.Discovered):
+    """Discovered accepting legacy float-second timestamps."""
+
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def timestamps_from_seconds(cls, value: Any) -> Any:
+        return _seconds_to_micros(value)
+
+
+class Affects(edges.Affects):
+    """Affects accepting legacy float-second timestamps."""
+
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def timestamps_from_seconds(cls, value: Any) -> Any:
+        return _seconds_to_micros(value)
@@ -5,7 +5,9 @@ Tests for generated Python code.
 import pytest
 from pydantic import ValidationError
 from pentagi_taxonomy import TAXONOMY_VERSION, ENTITY_TYPES, EDGE_TYPES, EDGE_TYPE_MAP
+from pentagi_taxonomy.entity_map import PORT_LIST_ADAPTER, NODE_ADAPTER, EDGE_ADAPTER, TARGET_ADAPTER, construct_target, dump_json, edge_types_for, get_field_description, make_target
 from pentagi_taxonomy.nodes import Target, Port, Vulnerability
+from pentagi_taxonomy import legacy
 from pentagi_taxonomy.edges import HasPort, Discovered, Affects
 
 
@@ -109,7 +111,7 @@ def test_vulnerability_validation():
 def test_edge_validation():
     """Test edge model validation."""
     discovered = Discovered(
-        timestamp=1234567890.0,
+        timestamp=1234567890_000_000,
         confidence=0.95,
         method="active"
     )
@@ -118,6 +120,10 @@ def test_edge_validation():
     # Confidence out of range
     with pytest.raises(ValidationError):
         Discovered(confidence=1.5)
+    
+    # Float seconds are rejected rather than read as microseconds
+    with pytest.raises(ValidationError):
+        Discovered(timestamp=1234567890.0)
 
 
 def test_all_fields_optional():
@@ -132,3 +138,169 @@ def test_all_fields_optional():
     vuln = Vulnerability()
     assert vuln.title is None
 
+
+def test_unknown_fields_rejected():
+    """Test that unknown fields are rejected instead of silently dropped."""
+    with pytest.raises(ValidationError):
+        Target(uuid="target-123")
+
+
+def test_type_adapter_helpers():
+    """Test that make_* helpers validate through the cached adapters."""
+    target = make_target(hostname="example.com", target_type="host")
+    assert isinstance(target, Target)
+    assert target.hostname == "example.com"
+    assert TARGET_ADAPTER.validate_python({"hostname": "example.com"}) == Target(hostname="example.com")
+    
+    with pytest.raises(ValidationError):
+        make_target(target_type="invalid_type")
+
+
+def test_discriminated_union_adapters():
+    """Test that mixed rows are dispatched on their 'type' tag."""
+    target, port = (NODE_ADAPTER.validate_python(row) for row in (
+        {"type": "Target", "hostname": "example.com"},
+        {"type": "Port", "port_number": 443},
+    ))
+    assert isinstance(target, Target)
+    assert isinstance(port, Port)
+    assert Port().type == "Port"
+    
+    edge = EDGE_ADAPTER.validate_python({"type": "HAS_PORT", "timestamp": 1_000_000})
+    assert isinstance(edge, HasPort)
+    
+    with pytest.raises(ValidationError):
+        NODE_ADAPTER.validate_python({"type": "Unknown"})
+
+
+def test_construct_helpers_skip_validation():
+    """Test that construct_* helpers build instances without validating."""
+    target = construct_target({"hostname": "example.com", "risk_score": 5.0})
+    assert isinstance(target, Target)
+    assert target.hostname == "example.com"
+    assert target.type == "Target"
+    assert target.model_fields_set == {"hostname", "risk_score"}
+    
+    # Trusted path: out-of-range values are not rejected
+    assert construct_target({"risk_score": 99.0}).risk_score == 99.0
+
+
+def test_timestamps_are_integer_microseconds():
+    """Test that timestamps are int microseconds, with a legacy float-seconds adapter."""
+    edge = HasPort(timestamp=1634567890_500_000)
+    assert edge.timestamp == 1634567890_500_000
+    
+    # Fractional seconds are not valid microsecond timestamps
+    with pytest.raises(ValidationError):
+        HasPort(timestamp=1634567890.5)
+    
+    # Whole-number float seconds must not be mistaken for microseconds
+    with pytest.raises(ValidationError):
+        HasPort(timestamp=1634567890.0)
+    
+    with pytest.raises(ValidationError):
+        HasPort.model_validate_json('{"timestamp": 1634567890.0}')
+    
+    with pytest.raises(ValidationError):
+        HasPort(timestamp=-1)
+    
+    legacy_edge = legacy.HasPort(timestamp=1634567890.5)
+    assert isinstance(legacy_edge, HasPort)
+    assert legacy_edge.timestamp == 1634567890_500_000
+    assert legacy.HasPort.model_validate_json('{"timestamp": 1634567890.0}').timestamp == 1634567890_000_000
+
+
+def test_dump_json():
+    """Test compact JSON serialization through the cached serializers."""
+    target = Target(hostname="example.com", target_type="host")
+    data = dump_json(target)
+    assert isinstance(data, bytes)
+    assert data == target.model_dump_json().encode()
+    assert Target.model_validate_json(data) == target
+    
+    legacy_edge = legacy.HasPort(timestamp=1.5)
+    assert dump_json(legacy_edge) == legacy_edge.model_dump_json().encode()
+
+
+def test_list_adapters():
+    """Test batch validation of Python rows and raw JSON arrays."""
+    ports = PORT_LIST_ADAPTER.validate_python([{"port_number": 22}, {"port_number": 443}])
+    assert [port.port_number for port in ports] == [22, 443]
+    assert all(isinstance(port, Port) for port in ports)
+    
+    ports = PORT_LIST_ADAPTER.validate_json(b'[{"port_number": 80, "protocol": "tcp"}]')
+    assert ports[0].protocol == "tcp"
+    
+    with pytest.raises(ValidationError):
+        PORT_LIST_ADAPTER.validate_python([{"port_number": 22}, {"port_number": 0}])
+
+
+def test_schemas_built_at_import():
+    """Test that validators and serializers are ready before first use."""
+    from pydantic_core import SchemaSerializer, SchemaValidator
+    
+    for model in (*ENTITY_TYPES.values(), *EDGE_TYPES.values()):
+        assert model.__pydantic_complete__
+        assert isinstance(model.__pydantic_validator__, SchemaValidator)
+        assert isinstance(model.__pydantic_serializer__, SchemaSerializer)
+
+
+def test_field_descriptions_side_table():
+    """Test that descriptions come from the side table, not the core schema."""
+    assert Target.model_fields["hostname"].description is None
+    assert get_field_description(Target, "hostname") == "DNS hostname if known"
+    assert get_field_description(legacy.HasPort, "timestamp") == get_field_description(HasPort, "timestamp")
+    assert get_field_description(Target, "type") is None
+    
+    # JSON schema still carries the descriptions, including for subclasses
+    schema = Target.model_json_schema()
+    assert schema["properties"]["hostname"]["description"] == "DNS hostname if known"
+    
+    class MyTarget(Target):
+        pass
+    
+    schema = MyTarget.model_json_schema()
+    assert schema["properties"]["hostname"]["description"] == "DNS hostname if known"
+    assert get_field_description(MyTarget, "hostname") == "DNS hostname if known"
+
+
+def test_msgspec_twins_match_json_shape():
+    """Test that msgspec twins round-trip the Pydantic JSON shape."""
+    pytest.importorskip("msgspec")
+    from pentagi_taxonomy import edges_fast, nodes_fast
+    
+    target = Target(hostname="example.com", target_type="host")
+    fast_target = nodes_fast.TARGET_DECODER.decode(dump_json(target))
+    assert isinstance(fast_target, nodes_fast.Target)
+    assert nodes_fast.ENCODER.encode(fast_target) == dump_json(target)
+    
+    edge = edges_fast.EDGE_DECODER.decode(b'{"type": "HAS_PORT", "timestamp": 1000000}')
+    assert isinstance(edge, edges_fast.HasPort)
+    assert edge.timestamp == 1_000_000
+
+
+def test_lookup_tables_are_frozen():
+    """Test read-only type maps and class-keyed edge lookup."""
+    with pytest.raises(TypeError):
+        ENTITY_TYPES['Other'] = Target
+    
+    with pytest.raises(TypeError):
+        EDGE_TYPES['OTHER'] = HasPort
+    
+    assert edge_types_for(Target, Port) == ('HAS_PORT',)
+    assert edge_types_for(Port, Target) == ()
+
+
+def test_from_trusted():
+    """Test the generated unvalidated fast-path constructor."""
+    target = Target.from_trusted(hostname="example.com", target_type="host")
+    assert target == Target.model_construct(hostname="example.com", target_type="host")
+    assert target.model_fields_set == {"hostname", "target_type"}
+    assert target.type == "Target"
+    assert Target.model_validate_json(dump_json(target)) == target
+    
+    # Trusted path: values are stored as given
+    assert Target.from_trusted(risk_score=99.0).risk_score == 99.0
+    
+    with pytest.raises(TypeError):
+        Target.from_trusted(unknown_field=1)